@@ -63,6 +63,12 @@ class Automaton(Generic[State, Input, Output]):
         assert initial is not None
         self._initialState: State = initial
         self._transitions: set[tuple[State, Input, State, Sequence[Output]]] = set()
+        # (inState, inputSymbol) -> (outState, outputSymbols); the dispatch
+        # table consulted on every transition, so that outputForInput need
+        # not scan the flat transition set.
+        self._byStateInput: dict[
+            tuple[State, Input], tuple[State, Sequence[Output]]
+        ] = {}
         self._unhandledTransition: Optional[tuple[State, Sequence[Output]]] = None
 
     @property
@@ -97,17 +103,16 @@ class Automaton(Generic[State, Input, Output]):
         Add the given transition to the outputSymbol. Raise ValueError if
         there is already a transition with the same inState and inputSymbol.
         """
-        # keeping self._transitions in a flat list makes addTransition
-        # O(n^2), but state machines don't tend to have hundreds of
-        # transitions.
-        for anInState, anInputSymbol, anOutState, _ in self._transitions:
-            if anInState == inState and anInputSymbol == inputSymbol:
-                raise ValueError(
-                    "already have transition from {} to {} via {}".format(
-                        inState, anOutState, inputSymbol
-                    )
+        existing = self._byStateInput.get((inState, inputSymbol))
+        if existing is not None:
+            raise ValueError(
+                "already have transition from {} to {} via {}".format(
+                    inState, existing[0], inputSymbol
                 )
-        self._transitions.add((inState, inputSymbol, outState, tuple(outputSymbols)))
+            )
+        outputs = tuple(outputSymbols)
+        self._transitions.add((inState, inputSymbol, outState, outputs))
+        self._byStateInput[(inState, inputSymbol)] = (outState, outputs)
 
     def unhandledTransition(
         self, outState: State, outputSymbols: Sequence[Output]
@@ -162,9 +167,10 @@ class Automaton(Generic[State, Input, Output]):
         """
         A 2-tuple of (outState, outputSymbols) for inputSymbol.
         """
-        for anInState, anInputSymbol, outState, outputSymbols in self._transitions:
-            if (inState, inputSymbol) == (anInState, anInputSymbol):
-                return (outState, list(outputSymbols))
+        transition = self._byStateInput.get((inState, inputSymbol))
+        if transition is not None:
+            outState, outputSymbols = transition
+            return (outState, list(outputSymbols))
         if self._unhandledTransition is None:
             raise NoTransition(state=inState, symbol=inputSymbol)
         return self._unhandledTransition
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import collections
 import inspect
+import sys
+from functools import lru_cache
 from typing import Any, Iterator
 
 from twisted.python.modules import PythonAttribute, PythonModule, getModule
@@ -10,22 +12,126 @@ from automat import MethodicalMachine
 
 from ._typed import TypeMachine, InputProtocol, Core
 
+_MACHINE_TYPES = (MethodicalMachine, TypeMachine)
 
-def isOriginalLocation(attr: PythonAttribute | PythonModule) -> bool:
+
+def _children(
+    node: PythonModule | PythonAttribute,
+) -> Iterator[tuple[str, PythonAttribute]]:
+    """
+    Yield (short name, wrapper) pairs for the attributes of C{node}.
+
+    C{PythonAttribute.name} is the fully-qualified dotted path; callers
+    keep re-deriving the final segment, so compute it once per child here.
+    """
+    for child in node.iterAttributes():
+        name = child.name
+        yield name[name.rfind(".") + 1 :], child
+
+
+_unloaded: Any = object()
+
+
+def isOriginalLocation(
+    attr: PythonAttribute | PythonModule, value: Any = _unloaded
+) -> bool:
     """
     Attempt to discover if this appearance of a PythonAttribute
     representing a class refers to the module where that class was
     defined.
+
+    @param value: the result of C{attr.load()}, if the caller has already
+        loaded it; omit to load it here.
     """
-    sourceModule = inspect.getmodule(attr.load())
-    if sourceModule is None:
+    if value is _unloaded:
+        value = attr.load()
+    # The class statement records the defining module on the class itself,
+    # so there is no need for inspect.getmodule's sys.modules walk.
+    sourceModuleName = getattr(value, "__module__", None)
+    if sourceModuleName is None:
         return False
 
     currentModule = attr
     while not isinstance(currentModule, PythonModule):
         currentModule = currentModule.onObject
 
-    return currentModule.name == sourceModule.__name__
+    return currentModule.name == sourceModuleName
+
+
+def _collect(
+    within: PythonModule | PythonAttribute,
+    results: list[tuple[str, MethodicalMachine | TypeMachine[InputProtocol, Core]]],
+) -> None:
+    """
+    Iterative worker for L{findMachinesViaWrapper}: walk C{within},
+    appending discovered (FQPN, machine) pairs to C{results}.
+
+    Running the whole walk in one plain function keeps its locals hot
+    and avoids a generator frame resume per node visited.
+    """
+    # Each queue entry pairs the wrapper with the name of the module its
+    # attributes were reached through, precomputed so class nodes need not
+    # re-walk the .onObject chain that isOriginalLocation would perform.
+    # The names are interned so that the __module__ comparison below is
+    # normally a pointer check: __module__ strings come from the import
+    # machinery, which interns them.
+    if isinstance(within, PythonModule):
+        enclosingModuleName = sys.intern(within.name)
+    else:
+        currentModule = within
+        while not isinstance(currentModule, PythonModule):
+            currentModule = currentModule.onObject
+        enclosingModuleName = sys.intern(currentModule.name)
+    queue: collections.deque[tuple[PythonModule | PythonAttribute, str]] = (
+        collections.deque([(within, enclosingModuleName)])
+    )
+    pop = queue.pop
+    append = queue.append
+    extend = queue.extend
+    found = results.append
+    # ids of machines and classes already seen, so that cycles terminate and
+    # each machine is yielded only once no matter how many names refer to it.
+    # Keying on id() sidesteps user-defined __hash__/__eq__ on machine-bearing
+    # classes; keepAlive roots the objects so their ids are never reused.
+    visitedValues: set[int] = set()
+    keepAlive: list[Any] = []
+    # FQPNs already walked; distinct wrapper objects for the same location
+    # would otherwise be re-load()ed and re-traversed.
+    visitedNames: set[str] = set()
+
+    while queue:
+        attr, moduleName = pop()
+        if attr.name in visitedNames:
+            continue
+        visitedNames.add(attr.name)
+        value = attr.load()
+        if isinstance(value, _MACHINE_TYPES) and id(value) not in visitedValues:
+            visitedValues.add(id(value))
+            keepAlive.append(value)
+            found((attr.name, value))
+        elif (
+            inspect.isclass(value)
+            and (
+                (sourceModuleName := getattr(value, "__module__", None)) is moduleName
+                or sourceModuleName == moduleName
+            )
+            and id(value) not in visitedValues
+        ):
+            visitedValues.add(id(value))
+            keepAlive.append(value)
+            # A class namespace is mostly dunder machinery that cannot hold a
+            # machine; filtering before enqueueing avoids load()ing it all.
+            for childName, child in _children(attr):
+                if not childName.startswith("__"):
+                    append((child, moduleName))
+        elif isinstance(attr, PythonModule) and id(value) not in visitedValues:
+            visitedValues.add(id(value))
+            keepAlive.append(value)
+            # list comprehensions rather than generator expressions: the
+            # deque can then size itself for the whole batch up front.
+            internedName = sys.intern(attr.name)
+            extend([(child, internedName) for child in attr.iterAttributes()])
+            extend([(mod, mod.name) for mod in attr.iterModules()])
 
 
 def findMachinesViaWrapper(
@@ -43,37 +149,16 @@ def findMachinesViaWrapper(
     accessible from module scope.  Machines inside nested classes will
     be discovered, but those returned from functions or methods will not be.
 
+    The walk itself happens eagerly, once the first pair is requested.
+
     @type within: L{PythonModule} or L{twisted.python.modules.PythonAttribute}
     @param within: Where to start the search.
 
     @return: a generator which yields FQPN, L{MethodicalMachine} pairs.
     """
-    queue = collections.deque([within])
-    visited: set[
-        PythonModule
-        | PythonAttribute
-        | MethodicalMachine
-        | TypeMachine[InputProtocol, Core]
-        | type[Any]
-    ] = set()
-
-    while queue:
-        attr = queue.pop()
-        value = attr.load()
-        if (
-            isinstance(value, MethodicalMachine) or isinstance(value, TypeMachine)
-        ) and value not in visited:
-            visited.add(value)
-            yield attr.name, value
-        elif (
-            inspect.isclass(value) and isOriginalLocation(attr) and value not in visited
-        ):
-            visited.add(value)
-            queue.extendleft(attr.iterAttributes())
-        elif isinstance(attr, PythonModule) and value not in visited:
-            visited.add(value)
-            queue.extendleft(attr.iterAttributes())
-            queue.extendleft(attr.iterModules())
+    results: list[tuple[str, MethodicalMachine | TypeMachine[InputProtocol, Core]]] = []
+    _collect(within, results)
+    yield from results
 
 
 class InvalidFQPN(Exception):
@@ -94,59 +179,71 @@ class NoObject(InvalidFQPN):
     """
 
 
+@lru_cache(maxsize=256)
 def wrapFQPN(fqpn: str) -> PythonModule | PythonAttribute:
     """
     Given an FQPN, retrieve the object via the global Python module
     namespace and wrap it with a L{PythonModule} or a
     L{twisted.python.modules.PythonAttribute}.
+
+    Results are cached, since wrapping walks the module hierarchy afresh
+    for every dotted component.
     """
     # largely cribbed from t.p.reflect.namedAny
 
     if not fqpn:
         raise InvalidFQPN("FQPN was empty")
 
-    components = collections.deque(fqpn.split("."))
+    parts = fqpn.split(".")
 
-    if "" in components:
+    if "" in parts:
         raise InvalidFQPN(
             "name must be a string giving a '.'-separated list of Python "
             "identifiers, not %r" % (fqpn,)
         )
 
-    component = components.popleft()
     try:
-        module = getModule(component)
+        module = getModule(parts[0])
     except KeyError:
-        raise NoModule(component)
+        raise NoModule(parts[0])
 
     # find the bottom-most module
-    while components:
-        component = components.popleft()
+    i = 1
+    while i < len(parts):
         try:
-            module = module[component]
+            module = module[parts[i]]
         except KeyError:
-            components.appendleft(component)
             break
-        else:
-            module.load()
-    else:
+        module.load()
+        i += 1
+    if i == len(parts):
         return module
 
-    # find the bottom-most attribute
+    # find the bottom-most attribute, continuing from where module
+    # resolution stopped
     attribute = module
-    for component in components:
+    for j in range(i, len(parts)):
+        component = parts[j]
+        children = dict(_children(attribute))
         try:
-            attribute = next(
-                child
-                for child in attribute.iterAttributes()
-                if child.name.rsplit(".", 1)[-1] == component
-            )
-        except StopIteration:
+            attribute = children[component]
+        except KeyError:
             raise NoObject("{}.{}".format(attribute.name, component))
 
     return attribute
 
 
+@lru_cache(maxsize=256)
+def _findMachines(
+    fqpn: str,
+) -> tuple[tuple[str, MethodicalMachine | TypeMachine[InputProtocol, Core]], ...]:
+    """
+    Memoized traversal behind L{findMachines}; repeated queries for the
+    same FQPN would otherwise re-import and re-walk the whole subtree.
+    """
+    return tuple(findMachinesViaWrapper(wrapFQPN(fqpn)))
+
+
 def findMachines(
     fqpn: str,
 ) -> Iterator[tuple[str, MethodicalMachine | TypeMachine[InputProtocol, Core]]]:
@@ -159,10 +256,13 @@ def findMachines(
     scope.  Machines inside nested classes will be discovered, but those
     returned from functions or methods will not be.
 
+    Results are cached per FQPN, so changes made to a package after its
+    first discovery will not be observed by later calls.
+
     @param fqpn: a fully-qualified Python identifier (i.e. the dotted
         identifier of an object defined at module or class scope, including the
         package and modele names); where to start the search.
 
     @return: a generator which yields (C{FQPN}, L{MethodicalMachine}) pairs.
     """
-    return findMachinesViaWrapper(wrapFQPN(fqpn))
+    return iter(_findMachines(fqpn))
@@ -195,7 +195,37 @@ def assertNoCode(f: Callable[..., Any]) -> None:
         raise ValueError("function body must be empty")
 
 
-def _filterArgs(args, kwargs, inputSpec, outputSpec):
+def _filterPlan(inputSpec, outputSpec):
+    """
+    Compute the parts of L{_filterArgs} that depend only on the two
+    signatures: the input's positional parameter names (sans self), its
+    (name, default) pairs, rightmost first, the indices of the input's
+    positional parameters that the output also accepts, and a frozenset
+    of the names the output will accept by keyword.  The specs do not
+    change once their input and output are declared, so
+    L{MethodicalMachine._oneTransition} computes this once per
+    (input, output) pair when the transition is declared and stores it on
+    the input, rather than on every call.  No caching happens here:
+    ArgSpec.defaults holds the default I{values}, which need not be
+    hashable, and a cache keyed on the specs' ids could outlive them and
+    collide with a later machine's specs.
+
+    :param ArgSpec inputSpec: The input's arg spec.
+    :param ArgSpec outputSpec: The output's arg spec.
+    :return: a (positional names, default pairs, accepted positional
+        indices, output accepted names) 4-tuple.
+    """
+    positional_names = inputSpec.args[1:]
+    output_args = frozenset(outputSpec.args)
+    return (
+        positional_names,
+        tuple(zip(inputSpec.args[::-1], inputSpec.defaults[::-1])),
+        tuple(i for i, n in enumerate(positional_names) if n in output_args),
+        frozenset(outputSpec.args[1:] + outputSpec.kwonlyargs),
+    )
+
+
+def _filterArgs(args, kwargs, inputSpec, outputSpec, plan=None):
     """
     Filter out arguments that were passed to input that output won't accept.
 
@@ -203,24 +233,30 @@ def _filterArgs(args, kwargs, inputSpec, outputSpec):
     :param dict kwargs: The **kwargs that input received.
     :param ArgSpec inputSpec: The input's arg spec.
     :param ArgSpec outputSpec: The output's arg spec.
+    :param plan: the precomputed result of L{_filterPlan} for the two
+        specs, if the caller has one; omit to compute it here.
     :return: The args and kwargs that output will accept.
     :rtype: Tuple[tuple, dict]
     """
-    named_args = tuple(zip(inputSpec.args[1:], args))
+    if plan is None:
+        plan = _filterPlan(inputSpec, outputSpec)
+    positional_names, default_pairs, accepted_positions, accepted_names = plan
+    named_args = tuple(zip(positional_names, args))
     if outputSpec.varargs:
         # Only return all args if the output accepts *args.
         return_args = args
     else:
-        # Filter out arguments that don't appear
-        # in the output's method signature.
-        return_args = [v for n, v in named_args if n in outputSpec.args]
+        # Keep only the positions the output's signature accepts; which
+        # positions those are was already worked out in _filterPlan, so no
+        # name lookups happen here.
+        n_args = len(args)
+        return_args = [args[i] for i in accepted_positions if i < n_args]
 
     # Get any of input's default arguments that were not passed.
     passed_arg_names = tuple(kwargs)
     for name, value in named_args:
         passed_arg_names += (name, value)
-    defaults = zip(inputSpec.args[::-1], inputSpec.defaults[::-1])
-    full_kwargs = {n: v for n, v in defaults if n not in passed_arg_names}
+    full_kwargs = {n: v for n, v in default_pairs if n not in passed_arg_names}
     full_kwargs.update(kwargs)
 
     if outputSpec.varkw:
@@ -228,10 +264,7 @@ def _filterArgs(args, kwargs, inputSpec, outputSpec):
         return_kwargs = full_kwargs
     else:
         # Filter out names that the output method does not accept.
-        all_accepted_names = outputSpec.args[1:] + outputSpec.kwonlyargs
-        return_kwargs = {
-            n: v for n, v in full_kwargs.items() if n in all_accepted_names
-        }
+        return_kwargs = {n: v for n, v in full_kwargs.items() if n in accepted_names}
 
     return return_args, return_kwargs
 
@@ -256,9 +289,18 @@ class MethodicalInput(object):
     )
 
     argSpec: ArgSpec = field(init=False, repr=False)
+    wrapperSymbol: str = field(init=False, repr=False)
+    # id(output) -> _filterPlan result, populated as transitions are
+    # declared.  The outputs are kept alive by this input's automaton, so
+    # the ids cannot be recycled while this dict is reachable, and the
+    # plans die with the machine rather than lingering in module state.
+    filterPlans: dict[int, tuple[Any, ...]] = field(
+        default_factory=dict, init=False, repr=False
+    )
 
     def __post_init__(self) -> None:
         self.argSpec = _getArgSpec(self.method)
+        self.wrapperSymbol = gensym()
         assertNoCode(self.method)
 
     def __get__(self, oself: object, type: None = None) -> object:
@@ -267,6 +309,13 @@ class MethodicalInput(object):
         by output functions produced by the given L{MethodicalInput} in
         C{oself}'s current state.
         """
+        # Building the bound wrapper below runs @wraps plus a code-object
+        # copy, which is far too expensive to repeat on every attribute
+        # access, so it is cached on the instance just like the
+        # transitioner.
+        existing = getattr(oself, self.wrapperSymbol, None)
+        if existing is not None:
+            return existing
         transitioner = _transitionerFromInstance(oself, self.symbol, self.automaton)
 
         @preserveName(self.method)
@@ -280,11 +329,20 @@ class MethodicalInput(object):
             for output in outputs:
                 if outTracer is not None:
                     outTracer(output)
-                a, k = _filterArgs(args, kwargs, self.argSpec, output.argSpec)
-                value = output(oself, *a, **k)
+                a, k = _filterArgs(
+                    args,
+                    kwargs,
+                    self.argSpec,
+                    output.argSpec,
+                    self.filterPlans.get(id(output)),
+                )
+                # calling the underlying method directly skips
+                # MethodicalOutput.__call__'s forwarding frame.
+                value = output.method(oself, *a, **k)
                 values.append(value)
             return collector(values)
 
+        setattr(oself, self.wrapperSymbol, doInput)
         return doInput
 
     def _name(self) -> str:
@@ -386,6 +444,7 @@ class MethodicalMachine(object):
         self._automaton = Automaton()
         self._reducers = {}
         self._symbol = gensym()
+        self._serializedStateMap: dict[Hashable, MethodicalState] | None = None
 
     def __get__(self, oself, type=None):
         """
@@ -479,10 +538,16 @@ class MethodicalMachine(object):
         #     if not isinstance(endState, MethodicalState):
         #         raise NotImplementedError("output state {} isn't a state"
         #                                   .format(endState))
-        self._automaton.addTransition(
-            startState, inputToken, endState, tuple(outputTokens)
-        )
+        outputTokens = tuple(outputTokens)
+        self._automaton.addTransition(startState, inputToken, endState, outputTokens)
         inputToken.collectors[startState] = collector
+        # Work out the argument-filtering plan for each (input, output)
+        # pair now, while both are known to be alive, so the invocation
+        # path need only look it up.
+        for output in outputTokens:
+            inputToken.filterPlans[id(output)] = _filterPlan(
+                inputToken.argSpec, output.argSpec
+            )
 
     @_keywords_only
     def serializer(self):
@@ -508,9 +573,15 @@ class MethodicalMachine(object):
             @wraps(decoratee)
             def unserialize(oself, *args, **kwargs):
                 state = decoratee(oself, *args, **kwargs)
-                mapping = {}
-                for eachState in self._automaton.states():
-                    mapping[eachState.serialized] = eachState
+                # The automaton is fully declared by the time any instance
+                # is unserialized, so the token-to-state mapping is computed
+                # once and reused rather than rebuilt per call.
+                mapping = self._serializedStateMap
+                if mapping is None:
+                    mapping = self._serializedStateMap = {
+                        eachState.serialized: eachState
+                        for eachState in self._automaton.states()
+                    }
                 transitioner = _transitionerFromInstance(
                     oself, self._symbol, self._automaton
                 )
@@ -7,7 +7,8 @@ from __future__ import annotations
 
 import sys
 
-from typing import TYPE_CHECKING, Callable, Protocol, TypeVar
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Protocol, TypeVar, get_type_hints
 
 from inspect import signature, Signature
 
@@ -22,14 +23,28 @@ def runtime_name(x: ProtocolAtRuntime[T]) -> str:
 
 from inspect import getmembers, isfunction
 
-emptyProtocolMethods: frozenset[str]
-if not TYPE_CHECKING:
-    emptyProtocolMethods = frozenset(
+
+@lru_cache(maxsize=None)
+def _emptyProtocolMethods() -> frozenset[str]:
+    """
+    The method names present on an empty L{Protocol} subclass; protocol
+    machinery, not anything a user defined.  Computed on first use rather
+    than at import, so merely importing automat does not pay for
+    synthesizing and interrogating a throwaway protocol class.
+    """
+    if TYPE_CHECKING:  # pragma: no cover
+        # the dynamically constructed Protocol subclass below is opaque to
+        # the type checker.
+        return frozenset()
+    return frozenset(
         name
         for name, each in getmembers(type("Example", tuple([Protocol]), {}), isfunction)
     )
 
 
+_protocolMethodsCache: dict[object, frozenset[str]] = {}
+
+
 def actuallyDefinedProtocolMethods(protocol: object) -> frozenset[str]:
     """
     Attempt to ignore implementation details, and get all the methods that the
@@ -37,26 +52,70 @@ def actuallyDefinedProtocolMethods(protocol: object) -> frozenset[str]:
 
     that includes locally defined methods and also those defined in inherited
     superclasses.
+
+    Results are memoized per protocol; protocol classes do not change after
+    definition, and the same protocol is re-interrogated every time a machine
+    is built from it.
     """
-    return (
-        frozenset(name for name, each in getmembers(protocol, isfunction))
-        - emptyProtocolMethods
+    try:
+        return _protocolMethodsCache[protocol]
+    except KeyError:
+        pass
+    # Walking each class dict along the MRO sees exactly the names that
+    # getmembers(protocol, isfunction) would, without dir()'s sorted list or
+    # a descriptor-resolving getattr per candidate attribute.
+    result = (
+        frozenset(
+            name
+            for klass in getattr(protocol, "__mro__", ())
+            for name, each in vars(klass).items()
+            if isfunction(each)
+        )
+        - _emptyProtocolMethods()
     )
+    _protocolMethodsCache[protocol] = result
+    return result
+
+
+@lru_cache(maxsize=None)
+def _returnHint(method: Callable[..., object]) -> object:
+    """
+    Get the evaluated return annotation of C{method} via
+    L{get_type_hints}, or L{Signature.empty} if it has none.  C{-> None}
+    evaluates to C{type(None)}, per C{get_type_hints}' usual
+    normalization.  Cached, since the same protocol methods are consulted
+    for every machine built from them.
+    """
+    return get_type_hints(method, include_extras=True).get("return", Signature.empty)
 
 
-def _fixAnnotation(method: Callable[..., object], it: object, ann: str) -> None:
-    annotation = getattr(it, ann)
-    if isinstance(annotation, str):
-        setattr(it, ann, eval(annotation, method.__globals__))
+_signatureCache: dict[Callable[..., object], Signature] = {}
 
 
 def _liveSignature(method: Callable[..., object]) -> Signature:
     """
-    Get a signature with evaluated annotations.
+    Get a signature with evaluated annotations, delegating string and
+    forward-reference resolution to L{get_type_hints} rather than eval()ing
+    each annotation by hand (which also had to reach into the private
+    C{_annotation} slots of the signature objects to do it).
+
+    Results are memoized per method: the same methods are interrogated
+    repeatedly while machines are being built.  L{Signature} objects are
+    immutable after construction, so sharing them is safe.
     """
-    # TODO: could this be replaced with get_type_hints?
+    try:
+        return _signatureCache[method]
+    except KeyError:
+        pass
     result = signature(method)
-    for param in result.parameters.values():
-        _fixAnnotation(method, param, "_annotation")
-    _fixAnnotation(method, result, "_return_annotation")
+    hints = get_type_hints(method, include_extras=True)
+    if hints:
+        result = result.replace(
+            parameters=[
+                param.replace(annotation=hints[name]) if name in hints else param
+                for name, param in result.parameters.items()
+            ],
+            return_annotation=hints.get("return", result.return_annotation),
+        )
+    _signatureCache[method] = result
     return result
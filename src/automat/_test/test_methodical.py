@@ -514,6 +514,90 @@ class MethodicalTests(TestCase):
         argsOut, _ = _filterArgs(argsIn, {}, inputSpec, outputSpec)
         self.assertIs(argsIn, argsOut)
 
+    def test_unhashableDefaultArgument(self):
+        """
+        Inputs and outputs whose signatures contain unhashable default
+        values, such as a mutable mapping, can still be invoked.
+        """
+
+        class Mechanism(object):
+            m = MethodicalMachine()
+
+            @m.input()
+            def go(self, opts={"a": 1}):
+                "an input"
+
+            @m.output()
+            def _takeOpts(self, opts={"a": 1}):
+                return opts
+
+            @m.state(initial=True)
+            def start(self):
+                "a state"
+
+            start.upon(go, enter=start, outputs=[_takeOpts])
+
+        self.assertEqual(Mechanism().go(), [{"a": 1}])
+
+    def test_filterPlansDieWithTheirMachine(self):
+        """
+        Argument-filtering state computed for one machine is never applied
+        to another: machines built after earlier ones have been
+        garbage-collected (whose object ids may be recycled) still filter
+        their own signatures correctly.
+        """
+        import gc
+
+        def oneArgMachine():
+            class Mechanism(object):
+                m = MethodicalMachine()
+
+                @m.input()
+                def go(self, x):
+                    "an input"
+
+                @m.output()
+                def _takeX(self, x):
+                    return x
+
+                @m.state(initial=True)
+                def start(self):
+                    "a state"
+
+                start.upon(go, enter=start, outputs=[_takeX])
+
+            return Mechanism
+
+        def twoArgMachine():
+            class Mechanism(object):
+                m = MethodicalMachine()
+
+                @m.input()
+                def go(self, x, y):
+                    "an input"
+
+                @m.output()
+                def _takeBoth(self, x, y):
+                    return (x, y)
+
+                @m.state(initial=True)
+                def start(self):
+                    "a state"
+
+                start.upon(go, enter=start, outputs=[_takeBoth])
+
+            return Mechanism
+
+        for _ in range(50):
+            one = oneArgMachine()
+            self.assertEqual(one().go(1), [1])
+            del one
+            gc.collect()
+            two = twoArgMachine()
+            self.assertEqual(two().go(1, 2), [(1, 2)])
+            del two
+            gc.collect()
+
     def test_multipleInitialStatesFailure(self):
         """
         A L{MethodicalMachine} can only have one initial state.
@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Callable, Generic, List, Protocol, TypeVar
 from unittest import TestCase, skipIf
+from weakref import ref
 
 from .. import AlreadyBuiltError, NoTransition, TypeMachineBuilder, pep614
 
@@ -111,6 +112,14 @@ class TypeMachineTests(TestCase):
         machine.change()
         self.assertEqual(machine.value(), 3)
 
+    def test_weakReferenceable(self) -> None:
+        """
+        Although machine instances have no instance C{__dict__}, they can
+        still be weakly referenced.
+        """
+        machine = machineFactory(NoOpCore())
+        self.assertIs(ref(machine)(), machine)
+
     def test_stateSpecificData(self) -> None:
 
         builder = TypeMachineBuilder(Counter, NoOpCore)
@@ -34,6 +34,7 @@ from ._core import Automaton, Transitioner
 from ._runtimeproto import (
     ProtocolAtRuntime,
     _liveSignature,
+    _returnHint,
     actuallyDefinedProtocolMethods,
     runtime_name,
 )
@@ -121,7 +122,7 @@ class TransitionRegistrar(Generic[P, P1, R]):
         assert builder is self._new.builder, "states must be from the same builder"
         builder._automaton.addTransition(
             self._old,
-            self._signature.__name__,
+            sys.intern(self._signature.__name__),
             self._new,
             tuple(self._new._produceOutputs(impl, self._old, self._nodata)),
         )
@@ -371,6 +372,19 @@ class InputImplementer(Generic[InputProtocol, Core]):
     When the factory returned from L{TypeMachine}
     """
 
+    # Declared by hand rather than via dataclass(slots=True) so that the
+    # layout is the same on every supported Python; slots also mean the
+    # fields cannot have class-level defaults, so the caller supplies them.
+    # __weakref__ is included so that instances remain weak-referenceable,
+    # as they were when they had a __dict__.
+    __slots__ = (
+        "__automat_core__",
+        "__automat_transitioner__",
+        "__automat_data__",
+        "__automat_postponed__",
+        "__weakref__",
+    )
+
     __automat_core__: Core
     __automat_transitioner__: Transitioner[
         TypedState[InputProtocol, Core]
@@ -378,8 +392,11 @@ class InputImplementer(Generic[InputProtocol, Core]):
         str,
         SomeOutput,
     ]
-    __automat_data__: object | None = None
-    __automat_postponed__: list[Callable[[], None]] | None = None
+    __automat_data__: object | None
+    __automat_postponed__: list[Callable[[], None]] | None
+
+
+_implementationCache: dict[Callable[..., object], Callable[..., object]] = {}
 
 
 def implementMethod(
@@ -389,12 +406,21 @@ def implementMethod(
     Construct a function for populating in the synthetic provider of the Input
     Protocol to a L{TypeMachineBuilder}.  It should have a signature matching that
     of the C{method} parameter, a function from that protocol.
+
+    The result depends only on C{method} itself, so it is memoized; building
+    several machines from the same protocol reuses the implementations.
     """
-    methodInput = method.__name__
+    try:
+        return _implementationCache[method]
+    except KeyError:
+        pass
+    # Interned so that the per-transition dispatch lookup compares the
+    # symbol by pointer rather than character by character.
+    methodInput = sys.intern(method.__name__)
     # side-effects can be re-ordered until later.  If you need to compute a
     # value in your method, then obviously it can't be invoked reentrantly.
-    returnAnnotation = _liveSignature(method).return_annotation
-    returnsNone = returnAnnotation is None
+    returnAnnotation = _returnHint(method)
+    returnsNone = returnAnnotation is type(None)
 
     def implementation(
         self: InputImplementer[InputProtocol, Core], *args: object, **kwargs: object
@@ -415,7 +441,7 @@ def implementMethod(
             return None
         postponed = self.__automat_postponed__ = []
         try:
-            [outputs, tracer] = transitioner.transition(methodInput)
+            outputs, tracer = transitioner.transition(methodInput)
             result: Any = None
             for output in outputs:
                 # here's the idea: there will be a state-setup output and a
@@ -435,6 +461,7 @@ def implementMethod(
     implementation.__qualname__ = implementation.__name__ = (
         f"<implementation for {method}>"
     )
+    _implementationCache[method] = implementation
     return implementation
 
 
@@ -464,16 +491,19 @@ class MethodOutput(Generic[Core]):
             No assertion about the data.
             """
 
-        # Do our best to compute the declared signature, so that we caan verify
-        # it's the right type.  We can't always do that.
-        try:
-            sig = _liveSignature(method)
-        except NameError:
-            ...
-            # An inner function may refer to type aliases that only appear as
-            # local variables, and those are just lost here; give up.
-        else:
-            if requiresData:
+        # The signature is only consulted to type-check the state-specific
+        # data argument, so methods that take none skip the resolution
+        # entirely.
+        if requiresData:
+            # Do our best to compute the declared signature, so that we caan
+            # verify it's the right type.  We can't always do that.
+            try:
+                sig = _liveSignature(method)
+            except NameError:
+                ...
+                # An inner function may refer to type aliases that only appear
+                # as local variables, and those are just lost here; give up.
+            else:
                 # 0: self, 1: self.__automat_core__, 2: self.__automat_data__
                 declaredParams = list(sig.parameters.values())
                 if len(declaredParams) >= 3:
@@ -512,15 +542,16 @@ class MethodOutput(Generic[Core]):
         *args: object,
         **kwargs: object,
     ) -> object:
-        extraArgs = [machine, machine.__automat_core__]
-        if self.requiresData:
-            self._assertion(dataAtStart)
-            extraArgs += [dataAtStart]
         # if anything is invoked reentrantly here, then we can't possibly have
         # set __automat_data__ and the data argument to the reentrant method
         # will be wrong.  we *need* to split out the construction / state-enter
         # hook, because it needs to run separately.
-        return self.method(*extraArgs, *args, **kwargs)
+        if self.requiresData:
+            self._assertion(dataAtStart)
+            return self.method(
+                machine, machine.__automat_core__, dataAtStart, *args, **kwargs
+            )
+        return self.method(machine, machine.__automat_core__, *args, **kwargs)
 
 
 @dataclass(frozen=True)
@@ -605,7 +636,7 @@ class TypeMachine(Generic[InputProtocol, Core]):
             initial = state
 
         internals: InputImplementer[InputProtocol, Core] = self.__automat_type__(
-            core, txnr := Transitioner(self.__automat_automaton__, initial)
+            core, txnr := Transitioner(self.__automat_automaton__, initial), None, None
         )
         result: InputProtocol = internals  # type:ignore[assignment]
 
@@ -718,8 +749,17 @@ class TypeMachineBuilder(Generic[InputProtocol, Core]):
             f"Typed<{runtime_name(self.inputProtocol)}>",
             tuple([InputImplementer]),
             {
-                method_name: implementMethod(getattr(self.inputProtocol, method_name))
-                for method_name in actuallyDefinedProtocolMethods(self.inputProtocol)
+                # no new slots, and no instance __dict__ either; all state
+                # lives in the slots declared on InputImplementer.
+                "__slots__": (),
+                **{
+                    method_name: implementMethod(
+                        getattr(self.inputProtocol, method_name)
+                    )
+                    for method_name in actuallyDefinedProtocolMethods(
+                        self.inputProtocol
+                    )
+                },
             },
         )
 